@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import async_timeout
+import random
+import time
+from functools import partial
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
@@ -12,60 +14,64 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
-from bleak import BleakError, BleakClient, BleakScanner
+from bleak import BleakError, BleakClient
 from .laifen import Laifen
 from datetime import timedelta
 
-from .const import DEVICE_TIMEOUT, DOMAIN, UPDATE_SECONDS
+from .const import (
+    DEVICE_TIMEOUT,
+    DOMAIN,
+    RECOVERY_BACKOFF_MAX,
+    RECOVERY_DEBOUNCE_SECONDS,
+    UPDATE_SECONDS,
+)
 from .models import LaifenData, DEVICE_REGISTRY, DEVICE_SIGNAL
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH, Platform.NUMBER, Platform.SELECT, Platform.BINARY_SENSOR]
 _LOGGER = logging.getLogger(__name__)
 
-class MockBLEDevice:
-    def __init__(self, address):
-        self.address = address
-        self.name = "Laifen"
-
 LAST_KNOWN_STORE_VERSION = 1
 LAST_KNOWN_FILENAME = f"{DOMAIN}_last_known.json"
+LAST_KNOWN_SAVE_DELAY = 5  # seconds; coalesces per-tick writes into one
+
 
 class LaifenCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass: HomeAssistant, laifen: Laifen, device_address: str):
+    def __init__(self, hass: HomeAssistant, laifen: Laifen, device_address: str, store: Store):
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_SECONDS),
+            # The brush is idle almost all day, so most ticks return the same
+            # result dict. Skip listener callbacks when nothing changed;
+            # explicit async_set_updated_data() pushes still always notify.
+            always_update=False,
         )
         self.laifen = laifen
         self.device_address = device_address
-        self.lock = asyncio.Lock()
-        self._first_message = True
         self.device_asleep = False
-        self._reconnecting = asyncio.Lock()
-        self._store = Store(hass, LAST_KNOWN_STORE_VERSION, LAST_KNOWN_FILENAME)
+        self._store = store
+        # Set by the passive Bluetooth callback whenever the brush advertises,
+        # so reconnects can wait for it instead of polling with active scans.
+        self._ble_ready = asyncio.Event()
 
 
     async def _async_update_data(self):
         if self.device_asleep:
-            _LOGGER.debug(f"{self.device_address} is asleep. Skipping update.")
-            restored = await self._async_restore_data()
-            self.async_set_updated_data(restored or {})
-            return restored or {}
+            _LOGGER.debug("%s is asleep. Skipping update.", self.device_address)
+            return await self._async_restore_data() or {}
         
         if not self.laifen:
-            _LOGGER.debug(f"{self.device_address}: coordinator has no device yet; restoring cached data.")
-            restored = await self._async_restore_data()
-            self.async_set_updated_data(restored or {})
-            return restored or {}
+            _LOGGER.debug("%s: coordinator has no device yet; restoring cached data.", self.device_address)
+            return await self._async_restore_data() or {}
 
 
         try:
             # Add timeout for the entire operation
-            async with async_timeout.timeout(30):
+            async with asyncio.timeout(30):
                 # V2 Pro (Wave Pro) is local_push and streams its full status
                 # via notifications (periodic 0xC1-03 broadcasts plus
                 # change-triggered 0x81-03 updates). While brushing, it also
@@ -76,50 +82,111 @@ class LaifenCoordinator(DataUpdateCoordinator):
                 # and dropped writes (e.g. power-off not taking effect).
                 # For V2 Pro, skip the read entirely and rely purely on
                 # push notifications — just check connection health below.
-                if self.laifen._proto_version != "v2pro":
+                # Other protocols only fall back to a read when the brush
+                # has gone quiet, so an actively notifying device is never
+                # polled.
+                if (
+                    self.laifen._proto_version != "v2pro"
+                    and time.monotonic() - self.laifen._last_notify > UPDATE_SECONDS
+                ):
                     await self.laifen.gatherdata()
 
                 if self.laifen.result:
                     # Always check connection, even if not Running
                     if not self.laifen.client or not self.laifen.client.is_connected:
-                        _LOGGER.debug(f"{self.device_address} appears disconnected — attempting immediate reconnect.")
-                        if not await self.laifen._aggressive_reconnect(max_attempts=5):
-                            _LOGGER.warning("Reconnection failed for %s, marking asleep", self.device_address)
-                            self.device_asleep = True
-                            return await self._async_restore_data() or {}
+                        # Join the disconnect handler's reconnect loop (or
+                        # start one) instead of running a second loop inside
+                        # this tick's timeout. The loop marks the brush
+                        # asleep and pushes cached data itself if it gives up.
+                        _LOGGER.debug("%s appears disconnected — scheduling reconnect.", self.device_address)
+                        self.laifen.schedule_reconnect(max_attempts=5)
 
                     await self._async_store_data(self.laifen.result)
                     return self.laifen.result
 
                 else:
                     # No new data - use cached but don't mark as asleep yet
+                    # Returning the value is enough — the coordinator compares
+                    # it against self.data and only notifies on a change.
                     cached = await self._async_restore_data()
                     if cached:
-                        self.async_set_updated_data(cached)
                         return cached
                     
                     # Only mark as asleep if we have no data at all
                     self.device_asleep = True
-                    cached = await self._async_restore_data()
-                    self.async_set_updated_data(cached or {})
-                    return cached or {}
+                    return {}
 
                     
         except (BleakError, asyncio.TimeoutError) as e:
-            _LOGGER.debug(f"BLE error during update: {e}. Will retry before marking asleep.")
-            # Don't immediately mark as asleep - will happen automatically if retries fail
-            cached = await self._async_restore_data()
-            self.async_set_updated_data(cached or {})
-            return cached or {}
+            # Don't mark as asleep here - that happens automatically if the
+            # reconnect path gives up. Raising (rather than returning cached
+            # data) keeps last_update_success accurate and lets the
+            # coordinator apply its own retry handling.
+            raise UpdateFailed(f"Error updating {self.device_address}: {e}") from e
+
+    async def _async_load_all(self) -> dict:
+        """
+        Return the decoded last-known dict for all devices. The file is only
+        read on first use; after that every coordinator shares the same
+        in-memory copy in hass.data and the Store is effectively write-only.
+        """
+        domain_data = self.hass.data[DOMAIN]
+        if (all_data := domain_data.get("_lkstore_cache")) is None:
+            # Devices are brought up concurrently, so several coordinators
+            # can get here at once — let them all await the same read.
+            if (load := domain_data.get("_lkstore_load")) is None:
+                load = domain_data["_lkstore_load"] = self.hass.async_create_task(
+                    self._store.async_load(), f"{DOMAIN} last-known load"
+                )
+            try:
+                loaded = await load
+            finally:
+                domain_data.pop("_lkstore_load", None)
+            all_data = domain_data.setdefault("_lkstore_cache", loaded or {})
+        return all_data
 
     async def _async_store_data(self, data: dict):
-        all_data = await self._store.async_load() or {}
-        all_data[self.device_address] = data
-        await self._store.async_save(all_data)
+        all_data = await self._async_load_all()
+        if all_data.get(self.device_address) == data:
+            return  # idle brush — nothing new to persist
+        # Keep a copy: the entities' optimistic writes and the V2 Pro
+        # telemetry path update laifen.result in place, which would
+        # otherwise make the comparison above always match.
+        all_data[self.device_address] = dict(data)
+        # Debounced: repeated calls within the window result in a single write
+        self._store.async_delay_save(lambda: all_data, LAST_KNOWN_SAVE_DELAY)
 
     async def _async_restore_data(self) -> dict | None:
-        all_data = await self._store.async_load() or {}
-        return all_data.get(self.device_address)
+        all_data = await self._async_load_all()
+        if (cached := all_data.get(self.device_address)) is None:
+            return None
+        # Hand out a copy: callers make this laifen.result / coordinator
+        # data, which is then updated in place, and must not alter the cache.
+        return dict(cached)
+
+    @callback
+    def async_set_ble_device_ready(self) -> None:
+        """Signal that the Bluetooth stack has just seen this device advertise."""
+        self._ble_ready.set()
+
+    async def async_wait_for_ble_device(self):
+        """
+        Return a connectable BLEDevice for this address from HA's Bluetooth
+        cache, waiting up to DEVICE_TIMEOUT for the next advertisement if the
+        brush isn't currently visible. Returns None if it never shows up.
+        """
+        address = self.device_address.upper()
+        ble_device = bluetooth.async_ble_device_from_address(self.hass, address, True)
+        if ble_device:
+            return ble_device
+
+        self._ble_ready.clear()
+        try:
+            async with asyncio.timeout(DEVICE_TIMEOUT):
+                await self._ble_ready.wait()
+        except asyncio.TimeoutError:
+            return None
+        return bluetooth.async_ble_device_from_address(self.hass, address, True)
 
     @callback
     def async_handle_notification(self, data):
@@ -129,29 +196,26 @@ class LaifenCoordinator(DataUpdateCoordinator):
         self.hass.async_create_task(self._async_store_data(data))
 
 
-    async def async_config_entry_first_refresh(self):
-        max_attempts = 10
-        attempts = 0
-        while attempts < max_attempts:
-            try:
-                await self.async_refresh()
-                break
-            except UpdateFailed:
-                attempts += 1
-                # _LOGGER.debug("Device not reachable, retrying in 30 seconds...")
-                await asyncio.sleep(30)
-
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Laifen for multiple devices, restoring stored devices and ensuring passive Bluetooth detection."""
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(entry.entry_id, {})  # don't overwrite on reload
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    laifens = hass.data[DOMAIN].setdefault("laifens", [])
-
-    stored_devices = entry_data
-    addresses = entry.data.get("devices", []) or list(stored_devices.keys())
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    laifens = domain_data.setdefault("laifens", [])
+    # One Store for the last-known file, shared by every coordinator, so
+    # their delayed saves coalesce instead of racing on the same file.
+    if (store := domain_data.get("_lkstore")) is None:
+        store = domain_data["_lkstore"] = Store(hass, LAST_KNOWN_STORE_VERSION, LAST_KNOWN_FILENAME)
+    # Per-entry state hangs off the entry itself, so the per-advertisement
+    # callbacks reach it with an attribute load instead of nested lookups.
+    entry.runtime_data = entry_data = {}
+    # address -> LaifenData, kept apart from the bookkeeping keys below
+    devices: dict[str, LaifenData] = entry_data.setdefault("devices", {})
+    # address -> Laifen, so per-advertisement callbacks are a single lookup
+    by_address = entry_data.setdefault("by_address", {})
+    # address -> cancel callback for a debounced recovery not yet started
+    pending_recovery = entry_data.setdefault("pending_recovery", {})
+
+    addresses = entry.data.get("devices", [])
 
     if not addresses:
         _LOGGER.warning("No Laifen devices found. Setup aborted until a device is added.")
@@ -161,61 +225,67 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     for addr in addresses:
         device = bluetooth.async_ble_device_from_address(hass, addr.upper(), True)
         if not device:
-            _LOGGER.debug(f"[Startup] BLE device {addr} not found (likely sleeping). Will restore passively.")
+            _LOGGER.debug("[Startup] BLE device %s not found (likely sleeping). Will restore passively.", addr)
         ble_devices.append(device)
 
-    for addr, ble_device in zip(addresses, ble_devices):
-        restored = None  # ✅ Always define restored
-
-        if addr in entry_data and isinstance(entry_data[addr], LaifenData):
-            # Device already initialized
-            laifen = entry_data[addr].device
-            coordinator = entry_data[addr].coordinator
-            has_cached_data = True  # Because we have previous data for this device
-            restored = await coordinator._async_restore_data()
-            _LOGGER.debug(f"Restored Laifen {addr} from previous data.")
-        else:
-            # First time initialization
-            coordinator = LaifenCoordinator(hass, None, addr)
-            laifen = Laifen(ble_device or MockBLEDevice(addr), coordinator)
-            coordinator.laifen = laifen
-            entry_data[addr] = LaifenData(entry.title, laifen, coordinator)
-            DEVICE_REGISTRY.setdefault(entry.entry_id, {})[addr] = entry_data[addr]
-            async_dispatcher_send(hass, f"{DEVICE_SIGNAL}_{entry.entry_id}_{addr}")
-
-            restored = await coordinator._async_restore_data()
-            has_cached_data = restored is not None
-
-            if has_cached_data:
-                coordinator.data = restored
-                coordinator.async_set_updated_data(restored)
-                laifen.result = restored
-                _LOGGER.warning(f"Restored Laifen {addr} from saved state.")
-            else:
-                laifen.result = {}
-                _LOGGER.warning(f"Initialized new Laifen {addr}.")
-
-
+    async def _bring_up(addr, ble_device):
+        # runtime_data is rebuilt on every setup, so each device is new here
+        coordinator = LaifenCoordinator(hass, None, addr, store)
+        laifen = Laifen(ble_device, coordinator, address=addr)
+        coordinator.laifen = laifen
+        devices[addr] = LaifenData(entry.title, laifen, coordinator)
+        DEVICE_REGISTRY.setdefault(entry.entry_id, {})[addr] = devices[addr]
+        # Register everywhere before the first await: if anything below
+        # raises, the advert callback must still find the brush so it can
+        # be recovered, instead of leaving entities with no device behind.
+        by_address[addr] = laifen
         laifens.append(laifen)
-        laifen.device_asleep = False
+        async_dispatcher_send(hass, f"{DEVICE_SIGNAL}_{entry.entry_id}_{addr}")
 
+        restored = await coordinator._async_restore_data()
+
+        if restored is not None:
+            coordinator.data = restored
+            coordinator.async_set_updated_data(restored)
+            laifen.result = restored
+            _LOGGER.warning("Restored Laifen %s from saved state.", addr)
+        else:
+            laifen.result = {}
+            _LOGGER.warning("Initialized new Laifen %s.", addr)
 
         if ble_device and await laifen.connect():
             await laifen.start_notifications()
             await coordinator.async_request_refresh()
         elif restored:
-            # _LOGGER.warning(f"Device {addr} is sleeping. Restoring last known values.")
             coordinator.data = restored
             coordinator.async_set_updated_data(restored)
         else:
-            _LOGGER.debug(f"Device {addr} is unavailable and no cached data found. Entities may state unavailable.")
+            _LOGGER.debug("Device %s is unavailable and no cached data found. Entities may state unavailable.", addr)
+
+    # Bring every brush up concurrently so startup takes as long as the
+    # slowest connect rather than the sum of all of them.
+    results = await asyncio.gather(
+        *(_bring_up(addr, ble_device) for addr, ble_device in zip(addresses, ble_devices)),
+        return_exceptions=True,
+    )
+    for addr, result in zip(addresses, results):
+        if isinstance(result, BaseException):
+            _LOGGER.warning("Failed to set up Laifen %s: %s", addr, result)
+
+    @callback
+    def _async_cancel_pending_recovery() -> None:
+        for cancel in pending_recovery.values():
+            cancel()
+        pending_recovery.clear()
+
+    entry.async_on_unload(_async_cancel_pending_recovery)
 
     # ✅ Register Passive Bluetooth Callbacks for Wake-Ups and Data Updates
     for addr in addresses:
         entry.async_on_unload(
             bluetooth.async_register_callback(
                 hass,
-                lambda service_info, change: asyncio.create_task(_async_device_recovery(hass, entry, service_info)),
+                partial(_async_dispatch_recovery, hass, entry),
                 BluetoothCallbackMatcher({ADDRESS: addr}),
                 bluetooth.BluetoothScanningMode.PASSIVE,
             )
@@ -225,7 +295,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, partial(_async_stop, hass))
     )
 
     return True
@@ -233,7 +303,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_stop(hass: HomeAssistant, event: Event) -> None:
     """Close all connections on shutdown."""
-    laifens = hass.data.get(DOMAIN, {}).get("laifens", [])
+    try:
+        laifens = hass.data[DOMAIN]["laifens"]
+    except KeyError:
+        return
     for laifen in laifens:
         await laifen.stop_notifications()
         await laifen.disconnect()
@@ -241,78 +314,134 @@ async def _async_stop(hass: HomeAssistant, event: Event) -> None:
     # _LOGGER.warning("Laifen devices successfully disconnected.")
 
 
-async def _async_device_recovery(hass: HomeAssistant, entry: ConfigEntry, service_info):
-    """Recover Laifen devices when they wake up via passive Bluetooth events."""
-
-    device_address = service_info.device.address
-    _LOGGER.debug(f"Bluetooth recovery callback fired for {device_address}")
-
-    entry_devices: dict[str, LaifenData] = hass.data[DOMAIN][entry.entry_id]
+@callback
+def _async_dispatch_recovery(hass: HomeAssistant, entry: ConfigEntry, service_info, change) -> None:
+    """
+    Passive Bluetooth callback. Runs for every advertisement, so it filters
+    synchronously and only schedules _async_device_recovery when the device
+    is one of ours and actually needs reconnecting.
+    """
+    address = service_info.device.address
+    laifen = entry.runtime_data["by_address"].get(address)
+    if laifen is None:
+        return
+
+    # Wake any reconnect loop waiting on this device's next advertisement
+    laifen.coordinator.async_set_ble_device_ready()
+
+    client = laifen.client
+    if client and client.is_connected:
+        return
+
+    # The last recovery failed recently — let the backoff window expire
+    # before building another client for this device.
+    if time.monotonic() < laifen._next_recovery:
+        return
+
+    # A waking brush sends a burst of adverts within milliseconds — only
+    # start recovery once the burst has settled, using the latest advert.
+    pending = entry.runtime_data["pending_recovery"]
+    if (cancel := pending.pop(address, None)) is not None:
+        cancel()
+    pending[address] = async_call_later(
+        hass,
+        RECOVERY_DEBOUNCE_SECONDS,
+        partial(_async_start_recovery, hass, entry, service_info),
+    )
 
-    if device_address in entry_devices:
-        _LOGGER.debug(f"Laifen {device_address} detected via Bluetooth callback! Restoring connection...")
 
-        laifen_data = entry_devices.get(device_address)
-        if not isinstance(laifen_data, LaifenData):
-            # _LOGGER.debug(f"Device {device_address} is stored incorrectly. Expected LaifenData but got {type(laifen_data)}.")
-            return
+@callback
+def _async_start_recovery(hass: HomeAssistant, entry: ConfigEntry, service_info, _now) -> None:
+    """Debounce timer fired — launch recovery for the most recent advertisement."""
+    address = service_info.device.address
+    entry.runtime_data["pending_recovery"].pop(address, None)
+    hass.async_create_background_task(
+        _async_device_recovery(hass, entry, service_info),
+        name=f"laifen-recovery-{address}",
+    )
 
-        laifen = laifen_data.device
-        # laifen.coordinator = laifen_data.coordinator  # ✅ ensure linked
-        coordinator = laifen_data.coordinator  # ✅ ensure linked
 
-        if laifen.client and laifen.client.is_connected:
-            _LOGGER.debug(f"{device_address} is already connected. Skipping recovery.")
-            return
+async def _async_device_recovery(hass: HomeAssistant, entry: ConfigEntry, service_info):
+    """Recover Laifen devices when they wake up via passive Bluetooth events."""
 
-        _LOGGER.debug(f"Old device for {device_address}: {laifen.ble_device}")
-        await laifen.set_ble_device(service_info.device)
-        _LOGGER.debug(f"Updated device for {device_address}: {laifen.ble_device}")
+    device_address = service_info.device.address
+    laifen: Laifen | None = entry.runtime_data["by_address"].get(device_address)
 
-        # If the passive scan gave an incomplete device, refresh it from a full scan
+    if laifen is None:
+        # ✅ Do not register new devices here
+        _LOGGER.debug("Laifen %s detected but not found in registered devices. Skipping recovery.", device_address)
+        return
+
+    # Cheapest check first — the device may have reconnected while this
+    # recovery was pending, in which case there is nothing to do.
+    if laifen.client and laifen.client.is_connected:
+        return
+
+    # Another recovery or the disconnect-driven reconnect loop is
+    # already connecting — don't start an overlapping attempt.
+    if laifen._reconnecting.locked():
+        _LOGGER.debug("%s is already reconnecting. Skipping recovery.", device_address)
+        return
+
+    _LOGGER.debug("Laifen %s detected via Bluetooth callback! Restoring connection...", device_address)
+
+    async with laifen._reconnecting:
+        # Repeat adverts usually carry the BLEDevice we already hold
+        if laifen.ble_device is not service_info.device:
+            _LOGGER.debug("Old device for %s: %s", device_address, laifen.ble_device)
+            await laifen.set_ble_device(service_info.device)
+            _LOGGER.debug("Updated device for %s: %s", device_address, laifen.ble_device)
+
+        # If the passive scan gave an incomplete device, take a connectable
+        # one from HA's Bluetooth cache rather than running an active scan.
         if not getattr(service_info.device, "details", None):
-            devices = await BleakScanner.discover()
-            for dev in devices:
-                if dev.address.lower() == device_address.lower():
-                    await laifen.set_ble_device(dev)
-                    break
+            ble_device = bluetooth.async_ble_device_from_address(hass, device_address.upper(), True)
+            if ble_device is None:
+                _LOGGER.debug("No connectable device for %s yet. Waiting for the next advertisement.", device_address)
+                return
+            await laifen.set_ble_device(ble_device)
 
         # Force new BleakClient to avoid stale connection object
         laifen.client = BleakClient(laifen.ble_device)
 
-        
         if await laifen.connect():
             await laifen.start_notifications()
             await laifen.coordinator.async_request_refresh()
-            _LOGGER.debug(f"Successfully reconnected to {device_address}.")
+            _LOGGER.debug("Successfully reconnected to %s.", device_address)
         else:
-            _LOGGER.debug(f"Failed to reconnect {device_address}. Retrying on next callback event.")
-    else:
-        # ✅ Do not register new devices here
-        _LOGGER.debug(f"Laifen {device_address} detected but not found in registered devices. Skipping recovery.")
+            delay = laifen._reconnect_backoff
+            # ±50% jitter so brushes that failed together (e.g. after an HA
+            # restart) don't all retry on the same advertisement.
+            laifen._next_recovery = time.monotonic() + delay * random.uniform(0.5, 1.5)
+            laifen._reconnect_backoff = min(RECOVERY_BACKOFF_MAX, delay * 2)
+            _LOGGER.debug("Failed to reconnect %s. Retrying on a callback after %ss.", device_address, delay)
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    data_dict = hass.data[DOMAIN].get(entry.entry_id, {})
-    for dev_addr, data in data_dict.items():
-        if isinstance(data, LaifenData):
-            await data.coordinator.async_request_refresh()
-        else:
-            _LOGGER.debug(f"Skipping refresh for unexpected object {dev_addr}: {type(data)}")
+    for data in entry.runtime_data["devices"].values():
+        await data.coordinator.async_request_refresh()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry and disconnect all devices."""
-    entry_devices = hass.data[DOMAIN].get(entry.entry_id, {})
-    for addr, data in entry_devices.items():
-        if isinstance(data, LaifenData):
-            try:
-                await data.device.stop_notifications()
-                await data.device.disconnect()
-                # _LOGGER.debug(f"Disconnected Laifen device {addr}")
-            except Exception as e:
-                _LOGGER.debug(f"Error disconnecting {addr}: {e}")
+    for addr, data in entry.runtime_data["devices"].items():
+        # A reconnect loop still running would revive this entry's Laifen
+        # and fight the reloaded entry's one for the brush.
+        if (task := data.device._reconnect_task) is not None:
+            task.cancel()
+        try:
+            await data.device.stop_notifications()
+            await data.device.disconnect()
+            # _LOGGER.debug(f"Disconnected Laifen device {addr}")
+        except Exception as e:
+            _LOGGER.debug("Error disconnecting %s: %s", addr, e)
+
+    # A reload builds fresh Laifen objects, so drop this entry's old ones
+    laifens = hass.data[DOMAIN]["laifens"]
+    for data in entry.runtime_data["devices"].values():
+        if data.device in laifens:
+            laifens.remove(data.device)
+    DEVICE_REGISTRY.pop(entry.entry_id, None)
 
-    hass.data[DOMAIN].pop(entry.entry_id, None)
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
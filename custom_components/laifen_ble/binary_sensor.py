@@ -6,7 +6,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .models import LaifenData, DEVICE_REGISTRY, laifen_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -162,7 +161,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for address in device_ids:
         data = DEVICE_REGISTRY.get(entry.entry_id, {}).get(address)
         if not data:
-            data = hass.data[DOMAIN][entry.entry_id].get(address)
+            data = entry.runtime_data["devices"].get(address)
 
         if isinstance(data, LaifenData):
             entities.append(
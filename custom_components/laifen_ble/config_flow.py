@@ -9,6 +9,7 @@ from homeassistant import config_entries
 from homeassistant.components import bluetooth
 from homeassistant.data_entry_flow import FlowResult
 from .const import DOMAIN
+from .laifen.laifen import SERVICE_UUID
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,22 +37,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 await active_scan(self.hass)
             except Exception as e:
-                _LOGGER.debug(f"async_request_active_scan failed: {e}")
+                _LOGGER.debug("async_request_active_scan failed: %s", e)
 
         # Discover available Bluetooth devices
         devices = bluetooth.async_discovered_service_info(self.hass)
 
-        _LOGGER.debug(f"Discovered devices: {[(d.name, d.address, d.service_uuids) for d in devices]}")
-
-        LAIFEN_SERVICE_UUID = "0000ff01-0000-1000-8000-00805f9b34fb"
+        # The cache can hold hundreds of adverts — only build the listing
+        # when someone is actually reading debug output.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Discovered devices: %s", [(d.name, d.address, d.service_uuids) for d in devices])
 
         found_devices = {}
         for device in devices:
-            name_match = device.name and device.name.startswith("LFTB")
-            uuid_match = LAIFEN_SERVICE_UUID in (device.service_uuids or [])
-            if name_match or uuid_match:
-                label = device.name or device.address
-                found_devices[label] = device.address
+            name = device.name or ""
+            if name.startswith("LFTB") or SERVICE_UUID in (device.service_uuids or ()):
+                found_devices[name or device.address] = device.address
 
         if not found_devices:
             _LOGGER.debug("No Laifen devices found via Bluetooth scan.")
@@ -7,15 +7,19 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class LaifenSensorEntityDescription(SensorEntityDescription):
     unique_id: str | None = None
 
 DOMAIN = "laifen_ble"
-UPDATE_SECONDS = 1
+# Entities are driven by GATT notifications; the coordinator tick is only a
+# watchdog for silent disconnects and for brushes that stopped notifying.
+UPDATE_SECONDS = 60
 DEVICE_TIMEOUT = 15
+RECOVERY_DEBOUNCE_SECONDS = 0.1
+RECOVERY_BACKOFF_MAX = 64
 
-SENSOR_TYPES = [
+SENSOR_TYPES: tuple[LaifenSensorEntityDescription, ...] = (
     LaifenSensorEntityDescription(
         key="status",
         translation_key="status",
@@ -80,7 +84,7 @@ SENSOR_TYPES = [
         unique_id="laifen_over_pressure_level",
         icon="mdi:gauge",
     ),
-]
+)
 
 # Mode options — Mode 4 is appended dynamically when HF is on
 MODE_OPTIONS_BASE = ["Mode 1", "Mode 2", "Mode 3"]
@@ -1,14 +1,24 @@
 import logging
 import asyncio
+import random
 import struct
-from bleak import BleakError, BleakClient, BleakScanner
-from bleak_retry_connector import establish_connection
+import time
+from bleak import BleakError, BleakClient
+from bleak.exc import BleakCharacteristicNotFoundError, BleakDeviceNotFoundError
+from bleak_retry_connector import BleakNotFoundError, establish_connection
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_UUID        = "0000ff01-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_UUID = "0000ff02-0000-1000-8000-00805f9b34fb"
 STORAGE_PATH        = "/config/.storage/laifen_ble_states.json"
+READ_TIMEOUT        = 5  # seconds for a single status read in gatherdata()
+
+# V1 protocol (AA-header) — every field we decode lives in bytes 0..23
+V1_MIN_LEN    = 24
+V1_STATUS_LEN = 25              # shortest status notification seen on the wire
+V1_PREFIX     = b"\xaa\x0a\x02"  # followed by 0x1? in byte[3]
+V1_BLOCK      = struct.Struct("<15B")  # bytes 4..18: mode, 4x (str, range, speed), airplane, battery
 
 # V2 protocol (5A-header) constants — speculative, unvalidated (LFTB02-S-7857)
 PROTO_V2_MAGIC = 0x5A
@@ -39,6 +49,58 @@ V2PRO_OVER_PRESSURE_LEVELS = {
     (1, 0xB8): "Hard",
 }
 
+# BlueZ's start_notify error when the subscription already exists
+# (e.g. after a reconnect) — treated as success
+_ALREADY_NOTIFYING = "Notifications are already enabled"
+
+# Little-endian u16 fields in V2 / V2 Pro payloads (speeds, durations)
+_U16LE = struct.Struct("<H")
+
+
+# Per-mode result keys, indexed by mode_index (0-3), so the parse and
+# write paths don't rebuild f"m{n}_..." strings on every call.
+_MODE_KEYS = tuple(
+    (f"m{n}_strength", f"m{n}_range", f"m{n}_speed") for n in range(1, 5)
+)
+
+# Template for packets that can't be decoded; _empty_result() copies it
+_EMPTY_RESULT = {
+    "status":             "Unknown",
+    "mode":               "1",
+    "mode_index":         0,
+    "battery_level":      0,
+    "brushing_time":      0,
+    "vibration_strength": 0,
+    "oscillation_range":  0,
+    "oscillation_speed":  0,
+    "m1_strength": 0, "m1_range": 0, "m1_speed": 0,
+    "m2_strength": 0, "m2_range": 0, "m2_speed": 0,
+    "m3_strength": 0, "m3_range": 0, "m3_speed": 0,
+    "m4_strength": 0, "m4_range": 0, "m4_speed": 0,
+    "airplane_mode":  False,
+    "high_frequency": False,
+    "reminder_30s":   False,
+}
+
+
+def _mode_keys(mode_index: int) -> tuple[str, str, str]:
+    """(strength, range, speed) result keys for a mode; Mode 1 if out of range."""
+    return _MODE_KEYS[mode_index] if 0 <= mode_index < len(_MODE_KEYS) else _MODE_KEYS[0]
+
+
+def _backoff(attempt: int, base: float = 1, cap: float = 30) -> float:
+    """
+    Exponential backoff with jitter: base * 2**attempt capped at cap, then
+    scaled by a random factor in [0.5, 1.5) so several brushes sharing an
+    adapter don't retry in lockstep.
+    """
+    return min(cap, base * 2 ** attempt) * (0.5 + random.random())
+
+
+def _is_v1_status(data: bytes) -> bool:
+    """True for a V1 status packet: AA 0A 02 1x header and full length."""
+    return len(data) >= V1_STATUS_LEN and data[:3] == V1_PREFIX and data[3] >> 4 == 1
+
 
 def _xor_checksum(data: list[int]) -> int:
     cs = 0
@@ -59,10 +121,18 @@ def build_command(param: int, b3: int, value: int) -> bytes:
     b3 is always 0x01.
     """
     data = [0xAA, 0x04, param, b3, value]
-    cs = 0
-    for b in data:
-        cs ^= b
-    data.append(cs)
+    data.append(_xor_checksum(data))
+    return bytes(data)
+
+
+def build_v1_toggle_command(opcode: int, enabled: bool) -> bytes:
+    """
+    Build a V1 on/off command: AA [opcode] 01 01 [val] [xor_cs]
+
+    Opcodes: 0x0F=Power, 0x0E=High Frequency, 0x07=Airplane, 0x0B=30s reminder
+    """
+    data = [0xAA, opcode, 0x01, 0x01, 0x01 if enabled else 0x00]
+    data.append(_xor_checksum(data))
     return bytes(data)
 
 
@@ -81,24 +151,38 @@ def build_v2pro_command(cmd: int, payload: list[int]) -> bytes:
     """
     data = [0xAA, (cmd >> 8) & 0xFF, cmd & 0xFF, 0x00, 0x00, len(payload)]
     data.extend(payload)
-    cs = 0
-    for b in data:
-        cs ^= b
-    data.append(cs)
+    data.append(_xor_checksum(data))
     return bytes(data)
 
 
+# Power commands are fixed — build them once
+_CMD_ON  = build_v1_toggle_command(0x0F, True)    # AA 0F 01 01 01 A4
+_CMD_OFF = build_v1_toggle_command(0x0F, False)   # AA 0F 01 01 00 A5
+_CMD_V2PRO_ON  = build_v2pro_command(0x0108, [0x01])
+_CMD_V2PRO_OFF = build_v2pro_command(0x0108, [0x00])
+
+
 class Laifen:
-    def __init__(self, ble_device, coordinator):
+    def __init__(self, ble_device, coordinator, address=None):
+        # ble_device may be None for a brush that was asleep at startup; it
+        # is filled in by set_ble_device() once the brush advertises.
         self.ble_device      = ble_device
-        self.address         = ble_device.address
-        self.name            = ble_device.name or "Laifen"
-        self.client          = BleakClient(ble_device)
+        self.address         = ble_device.address if ble_device else address
+        self.name            = (ble_device.name if ble_device else None) or "Laifen"
+        self.client          = BleakClient(ble_device) if ble_device else None
         self.result          = {}
         self.coordinator     = coordinator
         self.lock            = asyncio.Lock()
-        self._first_message  = True
+        self._connect_lock   = asyncio.Lock()
+        # coalesce_key -> sequence number of the newest queued write
+        self._cmd_seq: dict[str, int] = {}
         self._reconnecting   = asyncio.Lock()
+        self._reconnect_task = None
+        self._closing        = False       # set by disconnect(); no auto-reconnect after
+        self._last_notify    = 0.0         # time.monotonic() of last notification
+        # Advertisement-driven recovery backoff (seconds / monotonic deadline)
+        self._reconnect_backoff = 1
+        self._next_recovery     = 0.0
         self._proto_version  = None        # "v1" or "v2"
         self._brushing_active = False      # V2 only
 
@@ -111,19 +195,21 @@ class Laifen:
     # Connection management
     # ──────────────────────────────────────────────────────────────────
 
-    async def scan_for_devices(self):
-        scanner = BleakScanner()
-        devices = await scanner.discover()
-        found = [
-            d for d in devices
-            if d.name and (d.name.startswith("LFTB") or d.name.startswith("Laifen Toothbrush"))
-        ]
-        return found or None
-
     async def connect(self):
         if self.client and self.client.is_connected:
             return True
+        if self.ble_device is None:
+            return False
 
+        # Setup, advertisement recovery and the reconnect loop can all call
+        # connect() at once; let the first one do the work and the rest
+        # pick up its connection instead of queuing their own attempts.
+        async with self._connect_lock:
+            if self.client and self.client.is_connected:
+                return True
+            return await self._connect()
+
+    async def _connect(self):
         try:
             self.client = await establish_connection(
                 BleakClient,
@@ -134,52 +220,81 @@ class Laifen:
             )
             if self.coordinator:
                 self.coordinator.device_asleep = False
+            # A healthy session starts recovery over from the shortest
+            # window, whichever path (setup, reconnect loop, advert) got here
+            self._reconnect_backoff = 1
+            self._next_recovery     = 0.0
             try:
                 char = self.client.services.get_characteristic(CHARACTERISTIC_UUID)
                 if char:
                     _LOGGER.debug(
-                        f"[{self.address}] connect: resolved characteristic "
-                        f"{CHARACTERISTIC_UUID} -> handle={char.handle}, "
-                        f"properties={char.properties}, service={char.service_uuid}"
+                        "[%s] connect: resolved characteristic %s -> handle=%s, properties=%s, service=%s",
+                        self.address, CHARACTERISTIC_UUID, char.handle, char.properties, char.service_uuid,
                     )
                 else:
-                    _LOGGER.warning(f"[{self.address}] connect: characteristic {CHARACTERISTIC_UUID} NOT FOUND in services")
-                _LOGGER.debug(f"[{self.address}] connect: all services/characteristics:")
-                for svc in self.client.services:
-                    for c in svc.characteristics:
-                        _LOGGER.debug(f"[{self.address}]   svc={svc.uuid} char={c.uuid} handle={c.handle} props={c.properties}")
+                    _LOGGER.warning("[%s] connect: characteristic %s NOT FOUND in services", self.address, CHARACTERISTIC_UUID)
+                # Full GATT dump on every (re)connect — skip the walk entirely
+                # unless it will actually be logged.
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("[%s] connect: all services/characteristics:", self.address)
+                    for svc in self.client.services:
+                        for c in svc.characteristics:
+                            _LOGGER.debug("[%s]   svc=%s char=%s handle=%s props=%s", self.address, svc.uuid, c.uuid, c.handle, c.properties)
             except Exception as e:
-                _LOGGER.debug(f"[{self.address}] connect: failed to enumerate services: {e!r}")
+                _LOGGER.debug("[%s] connect: failed to enumerate services: %r", self.address, e)
             return True
         except asyncio.CancelledError:
             if self.coordinator:
                 self.coordinator.device_asleep = True
             return False
+        except (BleakNotFoundError, BleakDeviceNotFoundError):
+            # Expected whenever the brush is asleep or out of range — the
+            # passive callback reconnects it on its next advertisement.
+            _LOGGER.debug("%s not found; assuming it is asleep", self.address)
+            if self.coordinator:
+                self.coordinator.device_asleep = True
+            return False
         except (BleakError, asyncio.TimeoutError, TimeoutError) as e:
-            _LOGGER.warning(f"Failed to connect to {self.ble_device.address}: {e}")
+            _LOGGER.warning("Failed to connect to %s: %s", self.address, e)
             if self.coordinator:
                 self.coordinator.device_asleep = True
             return False
 
-    async def send_command(self, command: bytes):
+    async def send_command(self, command: bytes, coalesce_key: str | None = None):
+        """
+        Write a command to the control characteristic.
+
+        Writes are serialized by self.lock. When coalesce_key is given (one
+        key per setting), a write that is still waiting for the lock when a
+        newer write for the same key arrives is dropped — dragging a slider
+        or toggling a switch repeatedly then costs one GATT write for the
+        final value instead of one per step. A dropped write returns True:
+        the setting still ends up where the caller asked, and the newer
+        call reports the outcome of the actual write.
+        """
         cmd_hex = command.hex()
+        if coalesce_key is not None:
+            seq = self._cmd_seq[coalesce_key] = self._cmd_seq.get(coalesce_key, 0) + 1
         async with self.lock:
+            if coalesce_key is not None and self._cmd_seq[coalesce_key] != seq:
+                _LOGGER.debug("[%s] send_command(%s): superseded by a newer %s write", self.address, cmd_hex, coalesce_key)
+                return True
             if not self.client:
-                _LOGGER.warning(f"[{self.address}] send_command({cmd_hex}): no client object")
+                _LOGGER.warning("[%s] send_command(%s): no client object", self.address, cmd_hex)
                 return False
             if not self.client.is_connected:
-                _LOGGER.warning(f"[{self.address}] send_command({cmd_hex}): client not connected")
+                _LOGGER.warning("[%s] send_command(%s): client not connected", self.address, cmd_hex)
                 return False
             try:
-                _LOGGER.debug(f"[{self.address}] send_command: writing {cmd_hex} (proto={self._proto_version}) to {CHARACTERISTIC_UUID}, response=True")
+                _LOGGER.debug("[%s] send_command: writing %s (proto=%s) to %s, response=True", self.address, cmd_hex, self._proto_version, CHARACTERISTIC_UUID)
                 await self.client.write_gatt_char(CHARACTERISTIC_UUID, command, response=True)
-                _LOGGER.debug(f"[{self.address}] send_command: write of {cmd_hex} completed OK")
+                _LOGGER.debug("[%s] send_command: write of %s completed OK", self.address, cmd_hex)
                 return True
             except BleakError as e:
-                _LOGGER.warning(f"[{self.address}] send_command({cmd_hex}): BleakError: {e!r}")
+                _LOGGER.warning("[%s] send_command(%s): BleakError: %r", self.address, cmd_hex, e)
                 return False
             except Exception as e:
-                _LOGGER.warning(f"[{self.address}] send_command({cmd_hex}): unexpected error: {e!r}")
+                _LOGGER.warning("[%s] send_command(%s): unexpected error: %r", self.address, cmd_hex, e)
                 return False
 
     async def set_ble_device(self, ble_device):
@@ -191,25 +306,43 @@ class Laifen:
         self.client.set_disconnected_callback(self._handle_disconnect)
 
     async def disconnect(self):
+        # Intentional teardown (unload / HA stop): the disconnected callback
+        # this fires must not start a reconnect loop on a dead object.
+        self._closing = True
         if self.client and self.client.is_connected:
             try:
                 await self.stop_notifications()
                 await self.client.disconnect()
-                _LOGGER.debug(f"Disconnected {self.ble_device.address}")
+                _LOGGER.debug("Disconnected %s", self.address)
             except BleakError as e:
-                _LOGGER.debug(f"Error during disconnect: {e}")
+                _LOGGER.debug("Error during disconnect: %s", e)
             finally:
                 self.client = None
 
     def _handle_disconnect(self, client):
-        _LOGGER.debug(f"{self.ble_device.address} disconnected.")
+        _LOGGER.debug("%s disconnected.", self.address)
         if self.coordinator:
             self.coordinator.device_asleep = False
             # Push a coordinator update immediately so the Connection binary
             # sensor (and any other entities) reflect the disconnected state
             # without waiting for the next coordinator tick.
             self.coordinator.async_set_updated_data(self.result or {})
-            asyncio.create_task(self._aggressive_reconnect())
+            if not self._closing:
+                self.schedule_reconnect()
+
+    def schedule_reconnect(self, max_attempts=10):
+        """
+        Start the background reconnect loop unless one is already running,
+        and return its task. Only one loop per device — a second one would
+        just queue behind _reconnecting and then run its own full set of
+        attempts against the same adapter.
+        """
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self.coordinator.hass.async_create_background_task(
+                self._aggressive_reconnect(max_attempts=max_attempts),
+                name=f"laifen-reconnect-{self.address}",
+            )
+        return self._reconnect_task
 
     async def _aggressive_reconnect(self, max_attempts=10, initial_delay=1):
         async with self._reconnecting:
@@ -227,25 +360,33 @@ class Laifen:
             for attempt in range(max_attempts):
                 try:
                     if not self.client or not self.client.is_connected:
-                        devices = await BleakScanner.discover()
-                        for dev in devices:
-                            if dev.address.lower() == self.address.lower():
-                                await self.set_ble_device(dev)
-                                break
+                        # Wait for HA's Bluetooth stack to see the brush
+                        # advertise rather than running an active scan per
+                        # attempt — the brush is unreachable until it does.
+                        ble_device = await self.coordinator.async_wait_for_ble_device()
+                        if not ble_device:
+                            _LOGGER.debug("Reconnect attempt %s/%s: %s not advertising", attempt+1, max_attempts, self.address)
+                            continue
+                        await self.set_ble_device(ble_device)
                         await asyncio.sleep(initial_delay)
-                        _LOGGER.debug(f"Reconnect attempt {attempt+1}/{max_attempts} for {self.address}")
+                        _LOGGER.debug("Reconnect attempt %s/%s for %s", attempt+1, max_attempts, self.address)
                         if not self.client:
                             self.client = BleakClient(self.ble_device)
                         if await self.connect():
                             await self.start_notifications()
                             if self._proto_version != "v2pro":
                                 await self.gatherdata()
-                            _LOGGER.debug(f"Reconnected to {self.address}")
+                            _LOGGER.debug("Reconnected to %s", self.address)
                             # Push update so Connection sensor flips to ON
                             self.coordinator.async_set_updated_data(self.result or {})
                             return True
                 except Exception as e:
-                    _LOGGER.debug(f"Reconnect attempt {attempt+1} failed: {e}")
+                    _LOGGER.debug("Reconnect attempt %s failed: %s", attempt+1, e)
+
+                # The brush was visible but wouldn't connect — back off
+                # before the next try instead of hammering the adapter.
+                if attempt + 1 < max_attempts:
+                    await asyncio.sleep(_backoff(attempt, base=2, cap=20))
 
             cached = await self.coordinator._async_restore_data()
             self.coordinator.device_asleep = True
@@ -259,33 +400,47 @@ class Laifen:
     async def start_notifications(self):
         if not self.client or not self.client.is_connected:
             return
-        for attempt in range(5):
+        attempts = 5
+        for attempt in range(attempts):
             try:
                 await self.client.start_notify(CHARACTERISTIC_UUID, self.notification_handler)
                 return
+            except BleakCharacteristicNotFoundError:
+                # Not a transient failure — retrying can't make it appear
+                _LOGGER.warning("[%s] start_notifications: characteristic %s not found", self.address, CHARACTERISTIC_UUID)
+                break
             except BleakError as e:
-                if "Notifications are already enabled" in str(e):
+                if _ALREADY_NOTIFYING in str(e):
                     return
-                await asyncio.sleep(1)
+                if not self.client.is_connected:
+                    # Link dropped mid-attempt; the disconnect callback
+                    # owns recovery from here
+                    break
+                if attempt < attempts - 1:
+                    await asyncio.sleep(_backoff(attempt, base=0.5))
         if self.coordinator:
             self.coordinator.device_asleep = True
 
     async def stop_notifications(self):
-        async with self.lock:
-            if not self.client or not self.client.is_connected:
-                return
-            try:
-                await self.client.stop_notify(CHARACTERISTIC_UUID)
-            except BleakError:
-                return
+        # No self.lock here: this is a single awaitable with nothing to keep
+        # consistent across it, and on shutdown it must not queue behind a
+        # burst of pending writes.
+        if not self.client or not self.client.is_connected:
+            return
+        try:
+            await self.client.stop_notify(CHARACTERISTIC_UUID)
+        except BleakError:
+            return
 
     async def gatherdata(self):
         if not self.client or not self.client.is_connected:
             return
         try:
-            raw      = await self.client.read_gatt_char(CHARACTERISTIC_UUID)
-            data_str = raw.hex()
-            if data_str.startswith("aa0a021") and len(data_str) >= 50:
+            # A read on a half-dead link would otherwise stall until the
+            # coordinator's own 30 s timeout fires
+            async with asyncio.timeout(READ_TIMEOUT):
+                raw = await self.client.read_gatt_char(CHARACTERISTIC_UUID)
+            if _is_v1_status(raw):
                 parsed = self._parse_v1(raw)
                 if parsed:
                     self.result = parsed
@@ -300,28 +455,40 @@ class Laifen:
                 if parsed:
                     self.result = parsed
         except Exception as e:
-            _LOGGER.debug(f"[gatherdata] Error: {e}")
+            _LOGGER.debug("[gatherdata] Error: %s", e)
 
     def notification_handler(self, sender, data):
         if not self.coordinator:
             return
 
-        data_str = data.hex()
+        self._last_notify = time.monotonic()
 
-        _LOGGER.debug(
-            f"[{self.address}] notification_handler: {len(data)} bytes, "
-            f"data={data.hex()}, proto_before={self._proto_version}"
-        )
+        # Every packet is parsed, even a byte-identical repeat: the entities
+        # write optimistic values into self.result, and a repeat is what
+        # corrects them when the brush ignored the write. Unchanged packets
+        # are still kept off the coordinator by the parsed != self.result
+        # checks below.
+
+        # Runs for every packet (several per second while brushing) — only
+        # hex-encode when the record will actually be emitted.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[%s] notification_handler: %d bytes, data=%s, proto_before=%s",
+                self.address, len(data), data.hex(), self._proto_version,
+            )
 
         # V1 protocol
-        if data_str.startswith("aa0a021") and len(data_str) >= 50:
+        if _is_v1_status(data):
             self._proto_version = "v1"
             parsed = self._parse_v1(data)
             if parsed:
-                self.result = parsed
                 self.coordinator.device_asleep = False
-                self.coordinator.async_set_updated_data(self.result)
-            _LOGGER.debug(f"[{self.address}] -> matched V1, proto_after=v1")
+                # Same as the V2 Pro path below: skip the coordinator push
+                # (and every listener callback) when nothing changed.
+                if parsed != self.result:
+                    self.result = parsed
+                    self.coordinator.async_set_updated_data(self.result)
+            _LOGGER.debug("[%s] -> matched V1, proto_after=v1", self.address)
             return
 
         # V2 Pro protocol (Wave Pro / LFTB02-S-412B) — checked before the
@@ -350,7 +517,7 @@ class Laifen:
                 if parsed != self.result:
                     self.result = parsed
                     self.coordinator.async_set_updated_data(self.result)
-            _LOGGER.debug(f"[{self.address}] -> matched V2Pro, proto_after=v2pro")
+            _LOGGER.debug("[%s] -> matched V2Pro, proto_after=v2pro", self.address)
             return
 
         # V2 protocol (speculative, unvalidated — LFTB02-S-7857). A device
@@ -360,15 +527,16 @@ class Laifen:
             self._proto_version = "v2"
             parsed = self._parse_v2_packet(data)
             if parsed:
-                self.result = parsed
                 self.coordinator.device_asleep = False
-                self.coordinator.async_set_updated_data(self.result)
-            _LOGGER.debug(f"[{self.address}] -> matched V2-speculative, proto_after=v2")
+                if parsed != self.result:
+                    self.result = parsed
+                    self.coordinator.async_set_updated_data(self.result)
+            _LOGGER.debug("[%s] -> matched V2-speculative, proto_after=v2", self.address)
             return
 
-        _LOGGER.debug(f"[{self.address}] -> matched NOTHING, proto unchanged ({self._proto_version})")
+        _LOGGER.debug("[%s] -> matched NOTHING, proto unchanged (%s)", self.address, self._proto_version)
 
-        _LOGGER.debug(f"Unrecognised packet: {data_str[:40]}")
+        _LOGGER.debug("Unrecognised packet: %s", data[:20].hex())
 
     # ──────────────────────────────────────────────────────────────────
     # V1 Parser  (AA-header protocol — LFTB01)
@@ -405,92 +573,76 @@ class Laifen:
           [18]    Battery level (%)
           [22]    High Frequency flag (0=off, 1=on)
           [23]    Running flag: 0x01 = Running, 0x00 = Idle
-                  (data_str[47]=='1' is the same check)
+                  (only the low nibble is significant)
 
         Note: bytes[5,6,7] always show the ACTIVE mode's live values.
         bytes[8..16] show the STORED values for modes 2/3/4 — these only
         update when the app or HA writes to those modes while they are active.
         """
-        if data is None:
-            return self._empty_result(data)
-
-        data_str = data.hex()
+        if data is None or len(data) < V1_MIN_LEN:
+            return self._empty_result()
+
+        # Bytes 4..18 are one contiguous block — unpack it in a single call
+        (mode_byte,
+         active_strength, active_range, active_speed,
+         m2_str, m2_range, m2_speed,
+         m3_str, m3_range, m3_speed,
+         m4_str, m4_range, m4_speed,
+         airplane_byte, battery_level) = V1_BLOCK.unpack_from(data, 4)
+
+        # Mode index — byte[4], reliable at all times
+        mode_index = mode_byte if mode_byte <= 3 else self._current_mode_index
+        self._current_mode_index = mode_index
+
+        # Per-mode stored values — bytes[8..16]
+        # Mode 1 is always in [5,6,7] (active), so we synthesise m1_* from those
+        # when mode 1 is active; otherwise preserve cached m1 from prior result.
+        prev = self.result or {}
 
-        try:
-            # Mode index — byte[4], reliable at all times
-            mode_index = data[4] if len(data) > 4 and 0 <= data[4] <= 3 else self._current_mode_index
-            self._current_mode_index = mode_index
+        if mode_index == 0:
+            m1_str, m1_range, m1_speed = active_strength, active_range, active_speed
+        else:
+            m1_str   = prev.get("m1_strength", 0)
+            m1_range = prev.get("m1_range",    0)
+            m1_speed = prev.get("m1_speed",    0)
+
+        # When mode 2/3/4 is active, bytes[8..16] still hold ALL stored values
+        # but bytes[5,6,7] hold the live active ones. Keep stored values in sync
+        # for the active mode using the live bytes[5,6,7]:
+        if mode_index == 1:
+            m2_str, m2_range, m2_speed = active_strength, active_range, active_speed
+        elif mode_index == 2:
+            m3_str, m3_range, m3_speed = active_strength, active_range, active_speed
+        elif mode_index == 3:
+            m4_str, m4_range, m4_speed = active_strength, active_range, active_speed
+
+        # Feature flags
+        airplane_mode  = bool(airplane_byte)
+        high_frequency = bool(data[22])
+
+        # Running status — byte[23] low nibble, confirmed from laifen_12
+        status = "Running" if (data[23] & 0x0F) == 0x01 else "Idle"
 
-            # Active mode values — bytes[5,6,7]
-            active_strength = data[5] if len(data) > 5 else 0
-            active_range    = data[6] if len(data) > 6 else 0
-            active_speed    = data[7] if len(data) > 7 else 0
-
-            # Per-mode stored values — bytes[8..16]
-            # Mode 1 is always in [5,6,7] (active), so we synthesise m1_* from those
-            # when mode 1 is active; otherwise preserve cached m1 from prior result.
-            prev = self.result or {}
-
-            if mode_index == 0:
-                m1_str, m1_range, m1_speed = active_strength, active_range, active_speed
-            else:
-                m1_str   = prev.get("m1_strength", 0)
-                m1_range = prev.get("m1_range",    0)
-                m1_speed = prev.get("m1_speed",    0)
-
-            # Modes 2/3/4 are directly readable from packet
-            m2_str   = data[8]  if len(data) > 8  else prev.get("m2_strength", 0)
-            m2_range = data[9]  if len(data) > 9  else prev.get("m2_range",    0)
-            m2_speed = data[10] if len(data) > 10 else prev.get("m2_speed",    0)
-            m3_str   = data[11] if len(data) > 11 else prev.get("m3_strength", 0)
-            m3_range = data[12] if len(data) > 12 else prev.get("m3_range",    0)
-            m3_speed = data[13] if len(data) > 13 else prev.get("m3_speed",    0)
-            m4_str   = data[14] if len(data) > 14 else prev.get("m4_strength", 0)
-            m4_range = data[15] if len(data) > 15 else prev.get("m4_range",    0)
-            m4_speed = data[16] if len(data) > 16 else prev.get("m4_speed",    0)
-
-            # When mode 2/3/4 is active, bytes[8..16] still hold ALL stored values
-            # but bytes[5,6,7] hold the live active ones. Keep stored values in sync
-            # for the active mode using the live bytes[5,6,7]:
-            if mode_index == 1:
-                m2_str, m2_range, m2_speed = active_strength, active_range, active_speed
-            elif mode_index == 2:
-                m3_str, m3_range, m3_speed = active_strength, active_range, active_speed
-            elif mode_index == 3:
-                m4_str, m4_range, m4_speed = active_strength, active_range, active_speed
-
-            # Feature flags
-            airplane_mode  = bool(data[17]) if len(data) > 17 else False
-            battery_level  = data[18]       if len(data) > 18 else 0
-            high_frequency = bool(data[22]) if len(data) > 22 else False
-
-            # Running status — byte[23] low nibble, confirmed from laifen_12
-            status = "Running" if (len(data) > 23 and data[23] == 0x01) else "Idle"
-
-            return {
-                "raw_data":           data_str,
-                "status":             status,
-                "mode":               str(mode_index + 1),
-                "mode_index":         mode_index,
-                "battery_level":      battery_level,
-                "brushing_time":      0,
-                "vibration_strength": active_strength,
-                "oscillation_range":  active_range,
-                "oscillation_speed":  active_speed,
-                "active_strength":    active_strength,
-                "active_range":       active_range,
-                "active_speed":       active_speed,
-                "m1_strength": m1_str,   "m1_range": m1_range,   "m1_speed": m1_speed,
-                "m2_strength": m2_str,   "m2_range": m2_range,   "m2_speed": m2_speed,
-                "m3_strength": m3_str,   "m3_range": m3_range,   "m3_speed": m3_speed,
-                "m4_strength": m4_str,   "m4_range": m4_range,   "m4_speed": m4_speed,
-                "airplane_mode":      airplane_mode,
-                "high_frequency":     high_frequency,
-                "reminder_30s":       prev.get("reminder_30s", False),
-            }
-        except Exception as e:
-            _LOGGER.debug(f"V1 parse error: {e}")
-            return self._empty_result(data)
+        return {
+            "status":             status,
+            "mode":               str(mode_index + 1),
+            "mode_index":         mode_index,
+            "battery_level":      battery_level,
+            "brushing_time":      0,
+            "vibration_strength": active_strength,
+            "oscillation_range":  active_range,
+            "oscillation_speed":  active_speed,
+            "active_strength":    active_strength,
+            "active_range":       active_range,
+            "active_speed":       active_speed,
+            "m1_strength": m1_str,   "m1_range": m1_range,   "m1_speed": m1_speed,
+            "m2_strength": m2_str,   "m2_range": m2_range,   "m2_speed": m2_speed,
+            "m3_strength": m3_str,   "m3_range": m3_range,   "m3_speed": m3_speed,
+            "m4_strength": m4_str,   "m4_range": m4_range,   "m4_speed": m4_speed,
+            "airplane_mode":      airplane_mode,
+            "high_frequency":     high_frequency,
+            "reminder_30s":       prev.get("reminder_30s", False),
+        }
 
     # ──────────────────────────────────────────────────────────────────
     # V2 Parser  (5A-header protocol — LFTB02, firmware V1026+)
@@ -503,7 +655,8 @@ class Laifen:
         paylen = data[5]
         if len(data) < 6 + paylen + 1:
             return None
-        payload = data[6:6 + paylen]
+        # Zero-copy view; the parsers only index it and unpack from it
+        payload = memoryview(data)[6:6 + paylen]
 
         if cmd == V2_CMD_STATUS:
             return self._parse_v2_status(data, payload)
@@ -526,7 +679,7 @@ class Laifen:
         running  = self._brushing_active or (mode_idx > 0)
 
         speeds = [
-            struct.unpack_from("<H", payload, 5 + i * 2)[0]
+            _U16LE.unpack_from(payload, 5 + i * 2)[0]
             for i in range(4)
             if 5 + i * 2 + 2 <= len(payload)
         ]
@@ -534,7 +687,6 @@ class Laifen:
         brushing_sec  = payload[21] if payload[21] < 0x60 else 0
 
         return {
-            "raw_data":           raw.hex(),
             "status":             "Running" if running else "Idle",
             "mode":               str(mode_idx + 1),
             "mode_index":         mode_idx,
@@ -566,7 +718,6 @@ class Laifen:
         mode    = self.result.get("mode", "1")
         speed   = payload[1] if len(payload) > 1 else 0
         return {
-            "raw_data":           raw.hex(),
             "status":             "Running",
             "mode":               mode,
             "mode_index":         self.result.get("mode_index", 0),
@@ -620,7 +771,8 @@ class Laifen:
         if len(data) < 6 + paylen + 1:
             return None
 
-        payload = data[6:6 + paylen]
+        # Zero-copy view; the parsers only index it and unpack from it
+        payload = memoryview(data)[6:6 + paylen]
 
         if ptype in (V2PRO_TYPE_POLL, V2PRO_TYPE_STATUS) and subcmd == V2PRO_SUBCMD_STATUS:
             return self._parse_v2pro_status(data, payload)
@@ -632,9 +784,8 @@ class Laifen:
         if ptype == V2PRO_TYPE_TELEMETRY and subcmd == 0x0C and len(payload) >= 3:
             pressing_hard = payload[2] != 0
             _LOGGER.debug(
-                f"[{self.address}] 0x0C pressure: flag={payload[2]} "
-                f"raw_pressure={payload[3] if len(payload) > 3 else '?'} "
-                f"-> over_pressure_active={pressing_hard}"
+                "[%s] 0x0C pressure: flag=%s raw_pressure=%s -> over_pressure_active=%s",
+                self.address, payload[2], payload[3] if len(payload) > 3 else "?", pressing_hard,
             )
             if self.result is not None:
                 self.result["over_pressure_active"] = pressing_hard
@@ -668,10 +819,11 @@ class Laifen:
         this packet — those remain optimistic-only.
         """
         if len(payload) < 33:
-            _LOGGER.debug(
-                f"[{self.address}] _parse_v2pro_status: payload too short "
-                f"({len(payload)} bytes), raw={raw.hex()}"
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[%s] _parse_v2pro_status: payload too short (%d bytes), raw=%s",
+                    self.address, len(payload), raw.hex(),
+                )
             return None
 
         prev = self.result or {}
@@ -681,20 +833,29 @@ class Laifen:
         # Mode 0's duration sits at payload[5:7]; all modes are normally set
         # to the same value by the app. Reading the full 16-bit value (not
         # just the low byte) is required for durations >255s (e.g. 300s=0x012C).
-        duration_sec = payload[5] | (payload[6] << 8)
+        (duration_sec,) = _U16LE.unpack_from(payload, 5)
         status       = "Running" if payload[13] == 1 else "Idle"
 
         op_key   = (payload[27], payload[28])
         op_level = V2PRO_OVER_PRESSURE_LEVELS.get(op_key, "Unknown")
 
-        _LOGGER.debug(
-            f"[{self.address}] _parse_v2pro_status: raw={raw.hex()} "
-            f"p2(batt)={payload[2]} p5(dur)={payload[5]} p13(run)={payload[13]} "
-            f"p15(deepclean)={payload[15]} p16(antisplash)={payload[16]} "
-            f"p24(rampup)={payload[24]} p25(spin)={payload[25]} "
-            f"p26(overpress)={payload[26]} p27/28(level)={payload[27]}/{payload[28]} "
-            f"p30(bristle)={payload[30]} p32(wake)={payload[32]} -> status={status}"
-        )
+        active_keys = _mode_keys(prev.get("mode_index", 0))
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[%s] _parse_v2pro_status: raw=%s "
+                "p2(batt)=%s p5(dur)=%s p13(run)=%s "
+                "p15(deepclean)=%s p16(antisplash)=%s "
+                "p24(rampup)=%s p25(spin)=%s "
+                "p26(overpress)=%s p27/28(level)=%s/%s "
+                "p30(bristle)=%s p32(wake)=%s -> status=%s",
+                self.address, raw.hex(),
+                payload[2], payload[5], payload[13],
+                payload[15], payload[16],
+                payload[24], payload[25],
+                payload[26], payload[27], payload[28],
+                payload[30], payload[32], status,
+            )
 
         return {
             "status":              status,
@@ -733,9 +894,9 @@ class Laifen:
             "m4_strength": prev.get("m4_strength", 5),
             "m4_range":    prev.get("m4_range", 5),
             "m4_speed":    prev.get("m4_speed", 5),
-            "active_strength": prev.get("active_strength", prev.get(f"m{prev.get('mode_index', 0) + 1}_strength", 5)),
-            "active_range":    prev.get("active_range",    prev.get(f"m{prev.get('mode_index', 0) + 1}_range", 5)),
-            "active_speed":    prev.get("active_speed",    prev.get(f"m{prev.get('mode_index', 0) + 1}_speed", 5)),
+            "active_strength": prev.get("active_strength", prev.get(active_keys[0], 5)),
+            "active_range":    prev.get("active_range",    prev.get(active_keys[1], 5)),
+            "active_speed":    prev.get("active_speed",    prev.get(active_keys[2], 5)),
             # brushing_duration_sec: sourced from p5. The slider writes it
             # optimistically so the UI updates immediately; the next status
             # packet from the device will confirm or correct it.
@@ -750,16 +911,16 @@ class Laifen:
     # ──────────────────────────────────────────────────────────────────
 
     async def turn_on(self):
-        _LOGGER.debug(f"[{self.address}] turn_on: proto_version={self._proto_version}")
+        _LOGGER.debug("[%s] turn_on: proto_version=%s", self.address, self._proto_version)
         if self._proto_version == "v2pro":
-            return await self.send_command(build_v2pro_command(0x0108, [0x01]))
-        return await self.send_command(bytes.fromhex("AA0F010101A4"))
+            return await self.send_command(_CMD_V2PRO_ON, "power")
+        return await self.send_command(_CMD_ON, "power")
 
     async def turn_off(self):
-        _LOGGER.debug(f"[{self.address}] turn_off: proto_version={self._proto_version}")
+        _LOGGER.debug("[%s] turn_off: proto_version=%s", self.address, self._proto_version)
         if self._proto_version == "v2pro":
-            return await self.send_command(build_v2pro_command(0x0108, [0x00]))
-        return await self.send_command(bytes.fromhex("AA0F010100A5"))
+            return await self.send_command(_CMD_V2PRO_OFF, "power")
+        return await self.send_command(_CMD_OFF, "power")
 
     async def set_mode(self, mode_index: int) -> bool:
         """
@@ -779,13 +940,13 @@ class Laifen:
           fix up afterwards.
         """
         if self._proto_version == "v2pro":
-            success = await self.send_command(build_v2pro_command(0x0109, [mode_index]))
+            success = await self.send_command(build_v2pro_command(0x0109, [mode_index]), "mode")
             if success:
                 self._current_mode_index = mode_index
             return success
 
         cmd = build_command(0x01, 0x01, mode_index)
-        success = await self.send_command(cmd)
+        success = await self.send_command(cmd, "mode")
         if success:
             self._current_mode_index = mode_index
         return success
@@ -806,39 +967,43 @@ class Laifen:
         """
         result      = self.result or {}
         mode_index  = result.get("mode_index", 0)
-        base        = f"m{mode_index + 1}"
-        cur_strength = result.get(f"{base}_strength", 5)
-        cur_range    = result.get(f"{base}_range", 5)
-        cur_speed    = result.get(f"{base}_speed", 5)
+        strength_key, range_key, speed_key = _mode_keys(mode_index)
+        cur_strength = result.get(strength_key, 5)
+        cur_range    = result.get(range_key, 5)
+        cur_speed    = result.get(speed_key, 5)
 
+        key = None
         if strength is not None:
             cur_strength = strength
+            key = "strength"
         if range_ is not None:
             cur_range = range_
+            key = "range"
         if speed is not None:
             cur_speed = speed
+            key = "speed"
 
         return await self.send_command(
-            build_v2pro_command(0x0109, [mode_index, cur_strength, cur_range, cur_speed])
+            build_v2pro_command(0x0109, [mode_index, cur_strength, cur_range, cur_speed]), key
         )
 
     async def set_vibration_strength(self, value: int) -> bool:
         """Set vibration strength for the currently active mode. param=0x02 (V1) / setMode (V2 Pro)."""
         if self._proto_version == "v2pro":
             return await self._set_v2pro_mode_params(strength=value)
-        return await self.send_command(build_command(0x02, 0x01, value))
+        return await self.send_command(build_command(0x02, 0x01, value), "strength")
 
     async def set_oscillation_range(self, value: int) -> bool:
         """Set oscillation range for the currently active mode. param=0x03 (V1) / setMode (V2 Pro)."""
         if self._proto_version == "v2pro":
             return await self._set_v2pro_mode_params(range_=value)
-        return await self.send_command(build_command(0x03, 0x01, value))
+        return await self.send_command(build_command(0x03, 0x01, value), "range")
 
     async def set_oscillation_speed(self, value: int) -> bool:
         """Set oscillation speed for the currently active mode. param=0x04 (V1) / setMode (V2 Pro)."""
         if self._proto_version == "v2pro":
             return await self._set_v2pro_mode_params(speed=value)
-        return await self.send_command(build_command(0x04, 0x01, value))
+        return await self.send_command(build_command(0x04, 0x01, value), "speed")
 
     async def set_high_frequency(self, enabled: bool) -> bool:
         """
@@ -853,12 +1018,9 @@ class Laifen:
         """
         val = 0x01 if enabled else 0x00
         if self._proto_version == "v2pro":
-            return await self.send_command(build_v2pro_command(0x0203, [val]))
+            return await self.send_command(build_v2pro_command(0x0203, [val]), "high_frequency")
 
-        data = [0xAA, 0x0E, 0x01, 0x01, val]
-        cs   = 0
-        for b in data: cs ^= b
-        return await self.send_command(bytes(data + [cs]))
+        return await self.send_command(build_v1_toggle_command(0x0E, enabled), "high_frequency")
 
     async def set_airplane_mode(self, enabled: bool) -> bool:
         """
@@ -874,12 +1036,9 @@ class Laifen:
         """
         val = 0x01 if enabled else 0x00
         if self._proto_version == "v2pro":
-            return await self.send_command(build_v2pro_command(0x0202, [val]))
+            return await self.send_command(build_v2pro_command(0x0202, [val]), "airplane_mode")
 
-        data = [0xAA, 0x07, 0x01, 0x01, val]
-        cs   = 0
-        for b in data: cs ^= b
-        return await self.send_command(bytes(data + [cs]))
+        return await self.send_command(build_v1_toggle_command(0x07, enabled), "airplane_mode")
 
     async def set_reminder_30s(self, enabled: bool) -> bool:
         """
@@ -895,12 +1054,9 @@ class Laifen:
         """
         val = 0x01 if enabled else 0x00
         if self._proto_version == "v2pro":
-            return await self.send_command(build_v2pro_command(0x010C, [val]))
+            return await self.send_command(build_v2pro_command(0x010C, [val]), "reminder_30s")
 
-        data = [0xAA, 0x0B, 0x01, 0x01, val]
-        cs   = 0
-        for b in data: cs ^= b
-        return await self.send_command(bytes(data + [cs]))
+        return await self.send_command(build_v1_toggle_command(0x0B, enabled), "reminder_30s")
 
     # ──────────────────────────────────────────────────────────────────
     # Write commands — V2 Pro only (Wave Pro / LFTB02-S-412B)
@@ -913,30 +1069,30 @@ class Laifen:
     async def set_deep_clean(self, enabled: bool) -> bool:
         """CMD_TB_POWER_COMPEN=0x207 (setDeepCleanMode->setPowerCompenData). Readback: p15."""
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_deep_clean: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_deep_clean: not implemented for %s", self.address, self._proto_version)
             return False
-        return await self.send_command(build_v2pro_command(0x0207, [0x01 if enabled else 0x00]))
+        return await self.send_command(build_v2pro_command(0x0207, [0x01 if enabled else 0x00]), "deep_clean")
 
     async def set_anti_splash(self, enabled: bool) -> bool:
         """CMD_TB_PRESSDEVICE_ON=0x210 (setPressureOpen). Readback: p16."""
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_anti_splash: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_anti_splash: not implemented for %s", self.address, self._proto_version)
             return False
-        return await self.send_command(build_v2pro_command(0x0210, [0x01 if enabled else 0x00]))
+        return await self.send_command(build_v2pro_command(0x0210, [0x01 if enabled else 0x00]), "anti_splash")
 
     async def set_power_ramp_up(self, enabled: bool) -> bool:
         """CMD_TB_FADEIN_ONOFF=0x211 (setFadeIn), '3s Power Ramp-Up'. Readback: p24."""
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_power_ramp_up: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_power_ramp_up: not implemented for %s", self.address, self._proto_version)
             return False
-        return await self.send_command(build_v2pro_command(0x0211, [0x01 if enabled else 0x00]))
+        return await self.send_command(build_v2pro_command(0x0211, [0x01 if enabled else 0x00]), "power_ramp_up")
 
     async def set_bristle_protection(self, enabled: bool) -> bool:
         """CMD_TB_SLEEP_PROTEC_ONOFF=0x213 (setSleepProtect), 'Bristle Protection'. Readback: p30."""
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_bristle_protection: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_bristle_protection: not implemented for %s", self.address, self._proto_version)
             return False
-        return await self.send_command(build_v2pro_command(0x0213, [0x01 if enabled else 0x00]))
+        return await self.send_command(build_v2pro_command(0x0213, [0x01 if enabled else 0x00]), "bristle_protection")
 
     async def set_lift_to_wake(self, enabled: bool) -> bool:
         """CMD_TB_WAKEUP_MODE=0x208 (setWakeup), 'Lift to Wake' reminder. Readback: p32.
@@ -947,9 +1103,9 @@ class Laifen:
         payload may be needed.
         """
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_lift_to_wake: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_lift_to_wake: not implemented for %s", self.address, self._proto_version)
             return False
-        return await self.send_command(build_v2pro_command(0x0208, [0x01 if enabled else 0x00]))
+        return await self.send_command(build_v2pro_command(0x0208, [0x01 if enabled else 0x00]), "lift_to_wake")
 
     async def set_brushing_duration(self, value: int, mode: int | None = None) -> bool:
         """
@@ -973,7 +1129,7 @@ class Laifen:
         Range 60-300 seconds (1-5 min) in 30-second steps, matching the app.
         """
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_brushing_duration: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_brushing_duration: not implemented for %s", self.address, self._proto_version)
             return False
 
         seconds = max(60, min(300, int(round(value / 30) * 30)))
@@ -1002,7 +1158,7 @@ class Laifen:
         i.e. AA 02 0B 00 00 03 [enabled] [p27] [p28] [cs]
         """
         if self._proto_version != "v2pro":
-            _LOGGER.debug(f"[{self.address}] set_over_pressure_level: not implemented for {self._proto_version}")
+            _LOGGER.debug("[%s] set_over_pressure_level: not implemented for %s", self.address, self._proto_version)
             return False
 
         levels = {
@@ -1011,32 +1167,15 @@ class Laifen:
             "Hard":   (0x01, 0xB8),
         }
         if level not in levels:
-            _LOGGER.warning(f"[{self.address}] set_over_pressure_level: unknown level {level!r}")
+            _LOGGER.warning("[%s] set_over_pressure_level: unknown level %r", self.address, level)
             return False
 
         p27, p28 = levels[level]
-        return await self.send_command(build_v2pro_command(0x020B, [0x01, p27, p28]))
+        return await self.send_command(build_v2pro_command(0x020B, [0x01, p27, p28]), "over_pressure_level")
 
     # ──────────────────────────────────────────────────────────────────
     # Helpers
     # ──────────────────────────────────────────────────────────────────
 
-    def _empty_result(self, data):
-        return {
-            "raw_data":           data.hex() if data else "",
-            "status":             "Unknown",
-            "mode":               "1",
-            "mode_index":         0,
-            "battery_level":      0,
-            "brushing_time":      0,
-            "vibration_strength": 0,
-            "oscillation_range":  0,
-            "oscillation_speed":  0,
-            "m1_strength": 0, "m1_range": 0, "m1_speed": 0,
-            "m2_strength": 0, "m2_range": 0, "m2_speed": 0,
-            "m3_strength": 0, "m3_range": 0, "m3_speed": 0,
-            "m4_strength": 0, "m4_range": 0, "m4_speed": 0,
-            "airplane_mode":  False,
-            "high_frequency": False,
-            "reminder_30s":   False,
-        }
+    def _empty_result(self):
+        return _EMPTY_RESULT.copy()
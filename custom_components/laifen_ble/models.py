@@ -9,7 +9,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LaifenData:
     """Data for the Laifen integration."""
 
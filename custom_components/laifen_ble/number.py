@@ -7,7 +7,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DOMAIN,
     STRENGTH_MIN, STRENGTH_MIN_HF, STRENGTH_MAX_NORMAL, STRENGTH_MAX_HF,
     RANGE_MIN, RANGE_MAX,
     SPEED_MIN,  SPEED_MAX,
@@ -78,7 +77,7 @@ class LaifenVibrationStrength(CoordinatorEntity, NumberEntity):
             self.device.result["vibration_strength"] = int_val
             self.coordinator.async_set_updated_data(self.device.result)
         else:
-            _LOGGER.warning(f"Failed to set vibration strength to {int_val}")
+            _LOGGER.warning("Failed to set vibration strength to %s", int_val)
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
@@ -127,7 +126,7 @@ class LaifenOscillationRange(CoordinatorEntity, NumberEntity):
             self.device.result["oscillation_range"] = int_val
             self.coordinator.async_set_updated_data(self.device.result)
         else:
-            _LOGGER.warning(f"Failed to set oscillation range to {int_val}")
+            _LOGGER.warning("Failed to set oscillation range to %s", int_val)
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
@@ -176,7 +175,7 @@ class LaifenOscillationSpeed(CoordinatorEntity, NumberEntity):
             self.device.result["oscillation_speed"] = int_val
             self.coordinator.async_set_updated_data(self.device.result)
         else:
-            _LOGGER.warning(f"Failed to set oscillation speed to {int_val}")
+            _LOGGER.warning("Failed to set oscillation speed to %s", int_val)
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
@@ -234,7 +233,7 @@ class LaifenBrushingDuration(CoordinatorEntity, NumberEntity):
                 self.device.result["brushing_duration_sec"] = seconds
             self.coordinator.async_set_updated_data(self.device.result)
         else:
-            _LOGGER.warning(f"Failed to set brushing duration to {seconds}s")
+            _LOGGER.warning("Failed to set brushing duration to %ss", seconds)
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
@@ -248,7 +247,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for address in device_ids:
         data = DEVICE_REGISTRY.get(entry.entry_id, {}).get(address)
         if not data:
-            data = hass.data[DOMAIN][entry.entry_id].get(address)
+            data = entry.runtime_data["devices"].get(address)
         if isinstance(data, LaifenData):
             entities += [
                 LaifenVibrationStrength(data.device, data.coordinator),
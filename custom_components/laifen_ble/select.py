@@ -78,13 +78,13 @@ class LaifenModeSelect(CoordinatorEntity, SelectEntity):
         try:
             mode_index = int(option.split()[-1]) - 1
         except (ValueError, IndexError):
-            _LOGGER.warning(f"Invalid mode option: {option}")
+            _LOGGER.warning("Invalid mode option: %s", option)
             return
 
         # Step 1: send mode-select
         success = await self.device.set_mode(mode_index)
         if not success:
-            _LOGGER.warning(f"Failed to send mode-select for {option}")
+            _LOGGER.warning("Failed to send mode-select for %s", option)
             return
 
         base = f"m{mode_index + 1}"
@@ -199,7 +199,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for address in device_ids:
         data = DEVICE_REGISTRY.get(entry.entry_id, {}).get(address)
         if not data:
-            data = hass.data[DOMAIN][entry.entry_id].get(address)
+            data = entry.runtime_data["devices"].get(address)
         if isinstance(data, LaifenData):
             entities.append(LaifenModeSelect(data.device, data.coordinator))
             entities.append(LaifenOverPressureLevelSelect(data.device, data.coordinator))
@@ -8,7 +8,6 @@ from homeassistant.components.sensor import SensorEntity, SensorEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
@@ -20,7 +19,7 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=1)
 
-class LaifenSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
+class LaifenSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll     = False
 
@@ -44,21 +43,12 @@ class LaifenSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         await super().async_added_to_hass()
         self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
 
-        # Start periodic updates for timer logic
-        from datetime import timedelta
-        self.async_on_remove(
-            async_track_time_interval(self.hass, self.async_update, timedelta(seconds=1))
-        )
-
-        # Restore state if device result is missing (e.g. HA just restarted)
-        if not self.device.result:
-            last_state = await self.async_get_last_state()
-            if last_state and last_state.state and last_state.state != "unknown":
-                try:
-                    self._last_valid_value = float(last_state.state)
-                    # _LOGGER.debug(f"Restored state for {self.entity_id}: {self._last_valid_value}")
-                except ValueError:
-                    _LOGGER.debug(f"Could not restore state for {self.entity_id}: {last_state.state}")
+        # Only the synthetic timer needs a 1s tick; every other sensor is
+        # updated by the coordinator listener above.
+        if self.entity_description.key == "timer":
+            self.async_on_remove(
+                async_track_time_interval(self.hass, self.async_update, timedelta(seconds=1))
+            )
 
     async def _run_timer(self):
         """Increment the timer every second."""
@@ -87,9 +77,7 @@ class LaifenSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
             pass
 
     async def async_update(self, *args):
-        """Update the sensor state from the coordinator."""
-        await self.coordinator.async_request_refresh()
-
+        """Start or stop the brushing timer from the latest device status."""
         if self.device.result is not None:
             status = self.device.result.get("status")
 
@@ -99,14 +87,18 @@ class LaifenSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
                     # _LOGGER.debug(f"Timer detected RUNNING status for {self.entity_id}")
                     if self._timer_task is None:
                         # _LOGGER.debug(f"Starting Timer for {self.entity_id}")
-                        self._timer_task = asyncio.create_task(self._run_timer())
+                        self._timer_task = self.hass.async_create_background_task(
+                            self._run_timer(), name=f"laifen-timer-{self.device.address}"
+                        )
                 elif status == "Idle":
                     # _LOGGER.debug(f"Timer detected IDLE status for {self.entity_id}")
                     if self._timer_task is not None:
                         # _LOGGER.debug(f"Stopping Timer for {self.entity_id}, holding value")
                         self._timer_task.cancel()
                         self._timer_task = None
-                        asyncio.create_task(self._hold_timer())
+                        self.hass.async_create_background_task(
+                            self._hold_timer(), name=f"laifen-timer-hold-{self.device.address}"
+                        )
 
     @property
     def available(self) -> bool:
@@ -153,9 +145,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         # Try global registry first
         data = DEVICE_REGISTRY.get(entry.entry_id, {}).get(address)
 
-        # Fallback to hass.data if dispatcher not yet triggered
+        # Fallback to the entry's runtime data if dispatcher not yet triggered
         if not data:
-            data = hass.data[DOMAIN][entry.entry_id].get(address)
+            data = entry.runtime_data["devices"].get(address)
 
         if isinstance(data, LaifenData):
             for description in SENSOR_TYPES:
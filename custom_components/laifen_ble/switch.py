@@ -7,7 +7,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .models import LaifenData, DEVICE_REGISTRY, laifen_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,14 +33,14 @@ class LaifenPowerSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         success = await self.device.turn_on()
-        _LOGGER.debug(f"[{self.device.address}] LaifenPowerSwitch.async_turn_on: device.turn_on() -> {success}")
+        _LOGGER.debug("[%s] LaifenPowerSwitch.async_turn_on: device.turn_on() -> %s", self.device.address, success)
         if success:
             self._attr_is_on = True
             self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         success = await self.device.turn_off()
-        _LOGGER.debug(f"[{self.device.address}] LaifenPowerSwitch.async_turn_off: device.turn_off() -> {success}")
+        _LOGGER.debug("[%s] LaifenPowerSwitch.async_turn_off: device.turn_off() -> %s", self.device.address, success)
         if success:
             self._attr_is_on = False
             self.async_write_ha_state()
@@ -361,7 +360,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for address in device_ids:
         data = DEVICE_REGISTRY.get(entry.entry_id, {}).get(address)
         if not data:
-            data = hass.data[DOMAIN][entry.entry_id].get(address)
+            data = entry.runtime_data["devices"].get(address)
         if isinstance(data, LaifenData):
             entities += [
                 LaifenPowerSwitch(data.device, data.coordinator),